@@ -1,4 +1,5 @@
 import json
+import numpy as np
 from shapely import geometry
 import geopandas
 import geojson
@@ -26,7 +27,7 @@ def test_topology_winding_order_TopoOptions():
     topo = topojson.Topology(data, winding_order="CW_CCW").to_dict(options=True)
 
     assert len(topo["objects"]) == 1
-    assert len(topo["options"]) == 10
+    assert len(topo["options"]) == 11
 
 
 # test winding order using kwarg variables
@@ -37,7 +38,7 @@ def test_topology_winding_order_kwarg_vars():
     topo = topojson.Topology(data, winding_order="CW_CCW").to_dict(options=True)
 
     assert len(topo["objects"]) == 1
-    assert len(topo["options"]) == 10
+    assert len(topo["options"]) == 11
 
 
 def test_topology_computing_topology():
@@ -320,3 +321,190 @@ def test_topology_to_geojson_quantized_points_only():
         [999999, 999999],
     ]
     assert topo["transform"]["translate"] == [0.5, 0.5]
+
+
+def test_topology_multipoint_single_point():
+    data = [
+        {"type": "MultiPoint", "coordinates": [[0.5, 0.5]]},
+        {"type": "Point", "coordinates": [1.0, 1.0]},
+    ]
+    topo = topojson.Topology(data, topoquantize=True).to_dict()
+
+    assert topo["objects"]["data"]["geometries"][0]["coordinates"] == [[0, 0]]
+    assert topo["objects"]["data"]["geometries"][1]["coordinates"] == [
+        999999,
+        999999,
+    ]
+
+
+def test_topology_toposimplify_quantized_arcs_as_integers():
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    data = data[(data.continent == "Africa")]
+    topo = topojson.Topology(data, prequantize=1e4).toposimplify(0.5).to_dict()
+
+    assert "transform" in topo.keys()
+    assert all(isinstance(c, int) for arc in topo["arcs"] for xy in arc for c in xy)
+
+
+def test_topology_toposimplify_chaining_equals_option():
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    data = data[(data.continent == "Africa")]
+    topo = topojson.Topology(data, prequantize=1e5)
+    topo_chained = topo.toposimplify(0.5).to_dict()
+    topo_option = topojson.Topology(data, prequantize=1e5, toposimplify=0.5).to_dict()
+
+    assert topo_chained == topo_option
+    assert topo.toposimplify(0.5).toposimplify(0.5).to_dict() == topo_chained
+
+
+def test_topology_toposimplify_points_keep_quantized_coordinates():
+    data = [
+        {"type": "Polygon", "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10]]]},
+        {"type": "MultiPoint", "coordinates": [[5, 5], [2, 3]]},
+    ]
+    topo = topojson.Topology(data, prequantize=100)
+    topos = topo.toposimplify(0.1).to_dict()
+
+    assert topos["objects"] == topo.to_dict()["objects"]
+
+
+def test_topology_toposimplify_points_only():
+    data = [{"type": "MultiPoint", "coordinates": [[0.5, 0.5], [1.0, 1.0]]}]
+    topo = topojson.Topology(data, prequantize=True).toposimplify(1).to_dict()
+
+    assert len(topo["arcs"]) == 0
+    assert topo["objects"]["data"]["geometries"][0]["coordinates"] == [
+        [0, 0],
+        [999999, 999999],
+    ]
+
+
+def test_topology_toposimplify_below_quantization_grid():
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    data = data[(data.continent == "Africa")]
+    topo = topojson.Topology(data, prequantize=1e4)
+    scale = min(topo.output["transform"]["scale"])
+    topos = topo.toposimplify(0.5 * scale)
+
+    assert sum(map(len, topos.output["arcs"])) < sum(map(len, topo.output["arcs"]))
+
+    topo = topojson.Topology(data, topoquantize=1e4, toposimplify=1e-9)
+    topo_quantized = topojson.Topology(data).topoquantize(1e4)
+
+    assert topo.output["transform"] == topo_quantized.output["transform"]
+
+
+def test_topology_toposimplify_prequantize_beyond_int32():
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    data = data[(data.continent == "Africa")]
+    topo = topojson.Topology(data, prequantize=1e10, topoquantize=1e5, toposimplify=0.5)
+    coords = np.concatenate([np.cumsum(arc, axis=0) for arc in topo.output["arcs"]])
+
+    assert coords.min() >= 0
+    assert coords.max() < 1e5
+
+
+def test_topology_to_json_fp(tmp_path):
+    data = [
+        {"type": "LineString", "coordinates": [[4, 0], [2, 2], [0, 0]]},
+        {"type": "LineString", "coordinates": [[0, 2], [1, 1], [2, 2], [3, 1], [4, 2]]},
+    ]
+    topo = topojson.Topology(data)
+    fp = tmp_path / "topo.json"
+    topo.to_json(fp=fp)
+
+    assert json.loads(fp.read_text()) == json.loads(topo.to_json())
+
+
+def test_topology_toposimplify_parallel():
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    topo = topojson.Topology(data, prequantize=1e5, parallel=True)
+    topo_serial = topojson.Topology(data, prequantize=1e5, parallel=False)
+
+    assert topo.toposimplify(1).to_dict() == topo_serial.toposimplify(1).to_dict()
+
+
+def test_topology_toposimplify_parallel_auto(monkeypatch):
+    parallel_auto = topojson.ops._parallel_auto
+    monkeypatch.setattr(topojson.ops.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(topojson.ops.multiprocessing, "get_start_method", lambda: "fork")
+    monkeypatch.setattr(topojson.ops, "SHAPELY_GE_20", False)
+
+    assert parallel_auto(129, "shapely")
+    assert not parallel_auto(128, "shapely")
+
+    monkeypatch.setattr(topojson.ops, "SHAPELY_GE_20", True)
+
+    assert not parallel_auto(129, "shapely")
+    assert parallel_auto(129, "simplification")
+
+    monkeypatch.setattr(topojson.ops.multiprocessing, "get_start_method", lambda: "spawn")
+
+    assert not parallel_auto(129, "simplification")
+
+    monkeypatch.setattr(topojson.ops.multiprocessing, "get_start_method", lambda: "fork")
+    monkeypatch.setattr(topojson.ops.os, "cpu_count", lambda: 1)
+
+    assert not parallel_auto(129, "simplification")
+
+
+def test_topology_toposimplify_parallel_no_nested_pools(monkeypatch):
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    executors = []
+
+    class InlineExecutor:
+        # runs the chunks in the current process, so nested pools are recorded too
+        def __init__(self, max_workers):
+            executors.append(max_workers)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def map(self, fn, *iterables):
+            return map(fn, *iterables)
+
+    monkeypatch.setattr(topojson.ops.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(topojson.ops.multiprocessing, "get_start_method", lambda: "fork")
+    monkeypatch.setattr(topojson.ops, "ProcessPoolExecutor", InlineExecutor)
+    kwargs = {"prequantize": 1e5, "simplify_with": "simplification"}
+    topo = topojson.Topology(data, parallel="auto", **kwargs)
+    topo_serial = topojson.Topology(data, **kwargs)
+
+    assert topo.toposimplify(1).to_dict() == topo_serial.toposimplify(1).to_dict()
+    assert executors == [2]
+
+
+def test_topology_to_json_fp_options(tmp_path):
+    data = geopandas.read_file(geopandas.datasets.get_path("naturalearth_lowres"))
+    topo = topojson.Topology(data, toposimplify=1)
+    fp = tmp_path / "topo.json"
+    topo.to_json(fp=fp, options=True)
+
+    assert json.loads(fp.read_text()) == json.loads(topo.to_json(options=True))
+
+
+def test_topology_to_dict_copies_arcs():
+    data = [{"type": "LineString", "coordinates": [[0, 0], [1, 1], [2, 1]]}]
+    topo = topojson.Topology(data)
+    topo_dict = topo.to_dict()
+    topo_dict["arcs"][0][0][0] = 999
+
+    assert topo.to_dict()["arcs"][0][0][0] != 999
+
+
+def test_topology_topoquantize_keeps_source_unchanged():
+    data = [{"type": "LineString", "coordinates": [[0, 0], [1.5, 1.25], [2, 1]]}]
+    topo = topojson.Topology(data, prequantize=False)
+    topo_dict = topo.to_dict()
+    topo.topoquantize(10)
+
+    assert topo.to_dict() == topo_dict
+
+    topo = topojson.Topology(data)
+    topo_dict = topo.to_dict()
+    topo.topoquantize(10)
+
+    assert topo.to_dict() == topo_dict
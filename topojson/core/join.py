@@ -126,7 +126,7 @@ class Join(Extract):
         # presimplify linestrings if required
         if self.options.presimplify > 0:
             # set default if not specifically given in the options
-            if type(self.options.presimplify) == bool:
+            if isinstance(self.options.presimplify, bool):
                 simplify_factor = 2
             else:
                 simplify_factor = self.options.presimplify
@@ -152,7 +152,7 @@ class Join(Extract):
         # prequantize linestrings if required
         if self.options.prequantize > 0:
             # set default if not specifically given in the options
-            if type(self.options.prequantize) == bool:
+            if isinstance(self.options.prequantize, bool):
                 quant_factor = 1e6
             else:
                 quant_factor = self.options.prequantize
@@ -2,12 +2,17 @@ import pprint
 import copy
 import numpy as np
 import itertools
+from shapely import geometry
 from .hashmap import Hashmap
 from ..ops import np_array_from_arcs
+from ..ops import np_array_from_arcs_int
 from ..ops import dequantize
 from ..ops import quantize
+from ..ops import quantize_many
+from ..ops import remove_repeating_ndarray
 from ..ops import simplify
 from ..ops import delta_encoding
+from ..ops import delta_encoding_ndarray
 from ..utils import TopoOptions
 from ..utils import serialize_as_svg
 from ..utils import serialize_as_json
@@ -79,6 +84,12 @@ class Topology(Hashmap):
         between `CW_CCW` for clockwise orientation for outer rings and counter-
         clockwise for interior rings. Or `CCW_CW` for counter-clockwise for outer 
         rings and clockwise for interior rings. Default is `CW_CCW`.
+    parallel : boolean or str
+        If `True`, the arcs are simplified in parallel using multiple processes when
+        applying toposimplify. Scripts should then guard their entry point with
+        `if __name__ == "__main__":`. If `auto`, this is only done when there are
+        more than 128 arcs on multiple cores and processes can be forked.
+        Default is `False`.
     """
 
     def __init__(
@@ -94,21 +105,75 @@ class Topology(Hashmap):
         simplify_with="shapely",
         simplify_algorithm="dp",
         winding_order="CW_CCW",
+        parallel=False,
     ):
 
         options = TopoOptions(locals())
+        self._topo_pending = False
+        self._delta_pending = False
+        self._grid_factor = None
+        self._quant_factor = None
+
         # execute previous steps
         super().__init__(data, options)
 
-        # execute main function of Topology
-        self.output = self._topo(self.output)
+        # resolve the quantization factor of the grid on which the arcs are stored
+        if self.options.prequantize > 0:
+            # set default if not specifically given in the options
+            if isinstance(self.options.prequantize, bool):
+                self._grid_factor = 1e6
+            else:
+                self._grid_factor = self.options.prequantize
+
+        # resolve the quantization factor used to quantize again after simplifying
+        if self.options.topoquantize > 0:
+            # set default if not specifically given in the options
+            if isinstance(self.options.topoquantize, bool):
+                self._quant_factor = 1e6
+            else:
+                self._quant_factor = self.options.topoquantize
+        else:
+            self._quant_factor = self._grid_factor
+
+        # defer main function of Topology until the output is requested
+        self._topo_pending = True
+
+    @property
+    def output(self):
+        """
+        Output of the Topology. Reading it finalizes the arcs by applying the
+        delta-encoding that was deferred by `_topo`.
+        """
+        output = self._topo_output()
+        if self._delta_pending:
+            # apply the delta-encoding that was deferred by _topo
+            self._delta_pending = False
+            output["arcs"] = delta_encoding(output["arcs"])
+        return output
+
+    @output.setter
+    def output(self, value):
+        self._topo_pending = False
+        self._delta_pending = False
+        self._output = value
+
+    def _topo_output(self):
+        """
+        Return the output, after executing the main function of Topology if this is
+        still pending. A deferred delta-encoding of the arcs is not applied.
+        """
+        if self._topo_pending:
+            # execute main function of Topology
+            self._topo_pending = False
+            self._output = self._topo(self._output)
+        return self._output
 
     def __repr__(self):
         return "Topology(\n{}\n)".format(pprint.pformat(self.output))
 
     @property
     def __geo_interface__(self):
-        topo_object = copy.deepcopy(self.output)
+        topo_object = self._clone_output(copy_arcs=False)
         return serialize_as_geojson(topo_object, validate=False, lyr_idx=0)
 
     def to_dict(self, options=False):
@@ -121,7 +186,7 @@ class Topology(Hashmap):
             If `True`, the options also will be included. 
             Default is `False`
         """
-        topo_object = copy.deepcopy(self.output)
+        topo_object = self._clone_output()
         topo_object = self._resolve_coords(topo_object)
         if options:
             topo_object["options"] = vars(self.options)
@@ -165,7 +230,7 @@ class Topology(Hashmap):
             If `pretty=True`, declares the maximum length of each line.
             Default is `88`.
         """
-        topo_object = copy.deepcopy(self.output)
+        topo_object = self._clone_output(copy_arcs=False)
         topo_object = self._resolve_coords(topo_object)
         if options is True:
             topo_object["options"] = vars(self.options)
@@ -211,7 +276,7 @@ class Topology(Hashmap):
             The name of the object within the Topology to convert to GeoJSON.
             Default is `data` 
         """
-        topo_object = copy.deepcopy(self.output)
+        topo_object = self._clone_output(copy_arcs=False)
         topo_object = self._resolve_coords(topo_object)
         fc = serialize_as_geojson(topo_object, validate=validate, objectname=objectname)
         return serialize_as_json(
@@ -230,7 +295,7 @@ class Topology(Hashmap):
         """
         from ..utils import serialize_as_geodataframe
 
-        topo_object = copy.deepcopy(self.output)
+        topo_object = self._clone_output(copy_arcs=False)
         topo_object = self._resolve_coords(topo_object)
         return serialize_as_geodataframe(topo_object)
 
@@ -267,7 +332,7 @@ class Topology(Hashmap):
         """
         from ..utils import serialize_as_altair
 
-        topo_object = copy.deepcopy(self.output)
+        topo_object = self._clone_output()
         topo_object = self._resolve_coords(topo_object)
         return serialize_as_altair(
             topo_object, mesh, color, tooltip, projection, objectname
@@ -318,30 +383,35 @@ class Topology(Hashmap):
             Quantized coordinates and delta-encoded arcs or `None` if `inplace` 
             is `True`. 
         """
-        result = copy.deepcopy(self)
+        output = self._clone_output(copy_arcs=False)
+        result = copy.copy(self)
+        result.options = copy.copy(self.options)
+        result.output = output
         arcs = result.output["arcs"]
 
         if not arcs:
             return result
         # dequantize if quantization is applied
-        if "transform" in result.output.keys():
-            np_arcs = np_array_from_arcs(arcs)
+        if "transform" in result.output:
+            np_arcs, lengths = np_array_from_arcs_int(arcs, dtype=result._int_dtype())
 
             transform = result.output["transform"]
             scale = transform["scale"]
             translate = transform["translate"]
 
             np_arcs = dequantize(np_arcs, scale, translate)
-            l_arcs = []
-            for ls in np_arcs:
-                l_arcs.append(ls[~np.isnan(ls)[:, 0]].tolist())
-            arcs = l_arcs
+            arcs = [np_arcs[i, : lengths[i]].tolist() for i in range(len(lengths))]
+        else:
+            # quantize writes into the list of arcs, which is shared with self
+            arcs = list(arcs)
 
         arcs_qnt, transform = quantize(arcs, result.output["bbox"], quant_factor)
 
         result.output["arcs"] = delta_encoding(arcs_qnt)
         result.output["transform"] = transform
         result.options.topoquantize = quant_factor
+        result._quant_factor = quant_factor
+        result._grid_factor = quant_factor
 
         if inplace:
             # update into self
@@ -372,20 +442,37 @@ class Topology(Hashmap):
             Returns the Topology object with the simplified linestrings or `None` if
             `inplace` is `True`. 
         """
-        result = copy.deepcopy(self)
+        transform_present = "transform" in self._topo_output()
+        delta_pending = self._delta_pending
+
+        output = self._clone_output(copy_arcs=False, delta_encode=False)
+        result = copy.copy(self)
+        result.options = copy.copy(self.options)
+        result.output = output
 
         arcs = result.output["arcs"]
         if arcs:
-            np_arcs = np_array_from_arcs(arcs)
-
             # dequantize if quantization is applied
-            if "transform" in result.output.keys():
+            if transform_present:
 
                 transform = result.output["transform"]
                 scale = transform["scale"]
                 translate = transform["translate"]
 
-                np_arcs = dequantize(np_arcs, scale, translate)
+                dtype = result._int_dtype()
+                if delta_pending:
+                    # arcs from _topo are not yet delta-encoded, only rescale. Values
+                    # are truncated to integers, as is done by the delta-encoding
+                    arcs = [ls.coords if hasattr(ls, "coords") else ls for ls in arcs]
+                    np_arcs, lengths = np_array_from_arcs_int(arcs, dtype=dtype)
+                    np_arcs = np_arcs.astype(np.float64)
+                    np.multiply(np_arcs, scale, out=np_arcs)
+                    np.add(np_arcs, translate, out=np_arcs)
+                else:
+                    np_arcs, lengths = np_array_from_arcs_int(arcs, dtype=dtype)
+                    np_arcs = dequantize(np_arcs, scale, translate)
+            else:
+                np_arcs, lengths = np_array_from_arcs(arcs)
 
             result.output["arcs"] = simplify(
                 np_arcs,
@@ -394,82 +481,145 @@ class Topology(Hashmap):
                 package=result.options.simplify_with,
                 input_as=_input_as,
                 prevent_oversimplify=result.options.prevent_oversimplify,
+                lengths=lengths,
+                parallel=result.options.parallel,
             )
 
         # quantize aqain if quantization was applied
-        if "transform" in result.output.keys():
-            if result.options.topoquantize > 0:
-                # set default if not specifically given in the options
-                if type(result.options.topoquantize) == bool:
-                    quant_factor = 1e6
-                else:
-                    quant_factor = result.options.topoquantize
-            elif result.options.prequantize > 0:
-                # set default if not specifically given in the options
-                if type(result.options.prequantize) == bool:
-                    quant_factor = 1e6
-                else:
-                    quant_factor = result.options.prequantize
-
-            result.output["arcs"], transform = quantize(
-                result.output["arcs"], result.output["bbox"], quant_factor
-            )
+        if transform_present:
+            quant_factor = result._quant_factor
+            np_arcs = np_pts = None
+            if result.output["arcs"]:
+                np_arcs, lengths = np_array_from_arcs(result.output["arcs"])
+            if result.output.get("coordinates"):
+                # points are stored quantized, dequantize before quantizing again
+                transform = result.output["transform"]
+                np_pts = np.array([pt.coords[0] for pt in result.output["coordinates"]])
+                np_pts = np_pts * transform["scale"] + transform["translate"]
 
-            result.output["coordinates"], transform = quantize(
-                result.output["coordinates"], result.output["bbox"], quant_factor
+            (np_arcs, np_pts), transform = quantize_many(
+                [np_arcs, np_pts], result.output["bbox"], quant_factor
             )
 
-            result.output["arcs"] = delta_encoding(result.output["arcs"])
+            if np_arcs is not None:
+                np_arcs, lengths = remove_repeating_ndarray(np_arcs, lengths)
+                np_arcs = delta_encoding_ndarray(np_arcs)
+                result.output["arcs"] = [
+                    np_arcs[i, : lengths[i]].astype(np.int64).tolist()
+                    for i in range(len(lengths))
+                ]
+            if np_pts is not None:
+                result.output["coordinates"] = [geometry.Point(xy) for xy in np_pts]
             result.output["transform"] = transform
+            result._grid_factor = quant_factor
         if inplace:
             # update into self
-            self.output["arcs"] = result.output["arcs"]
-            if "transform" in result.output.keys():
-                self.output["transform"] = result.output["transform"]
+            self._output["arcs"] = result.output["arcs"]
+            self._delta_pending = False
+            if transform_present:
+                self._output["transform"] = result.output["transform"]
+                self._grid_factor = result._grid_factor
+                if "coordinates" in result.output:
+                    self._output["coordinates"] = result.output["coordinates"]
             # self.output["arcs"] = result.output["arcs"]
             # self.output["transform"] = result.output["transform"]
         else:
             return result
 
+    def _int_dtype(self):
+        """
+        Integer type that can hold the arcs on the quantization grid of the output.
+        """
+        if self._grid_factor is None or self._grid_factor < 2 ** 31:
+            return np.int32
+        return np.int64
+
+    def _clone_output(self, copy_arcs=True, delta_encode=True):
+        """
+        Copy the output, limited to the members that are mutated downstream. Set
+        `copy_arcs` to `False` to share the arcs with the output when the copy is
+        serialized directly or when the arcs are replaced anyway. Otherwise the arcs
+        are copied up to the level of the coordinates, so the copy can be handed out
+        to the user. The points are always shared, as these are only read. Set
+        `delta_encode` to `False` to leave a deferred delta-encoding of the arcs
+        pending.
+        """
+        source = self.output if delta_encode else self._topo_output()
+        output = source.copy()
+        output["objects"] = copy.deepcopy(source["objects"])
+        if "transform" in output:
+            output["transform"] = copy.deepcopy(source["transform"])
+        if copy_arcs:
+            output["arcs"] = [[xy[:] for xy in arc] for arc in source["arcs"]]
+        return output
+
     def _resolve_coords(self, data):
+        # nothing to resolve if there are no (multi)point features
+        if not data.get("coordinates"):
+            data.pop("coordinates", None)
+            return data
+
         geoms = data["objects"]["data"]["geometries"]
-        for idx, feat in enumerate(geoms):
+
+        # collect the point indices of all (multi)point features in one flat list
+        point_feats = []
+        flat_idx = []
+        offsets = [0]
+        for feat in geoms:
             if feat["type"] in ["Point", "MultiPoint"]:
 
-                lofl = feat["coordinates"]
+                feat_idx = feat["coordinates"]
                 repeat = 1 if feat["type"] == "Point" else 2
 
                 for _ in range(repeat):
-                    lofl = list(itertools.chain(*lofl))
-
-                for idx, val in enumerate(lofl):
-                    coord = data["coordinates"][val]
-                    lofl[idx] = [int(coord.xy[0][0]), int(coord.xy[1][0])]
-
-                feat["coordinates"] = lofl[0] if len(lofl) == 1 else lofl
+                    feat_idx = itertools.chain.from_iterable(feat_idx)
+
+                flat_idx.extend(feat_idx)
+                offsets.append(len(flat_idx))
+                point_feats.append(feat)
+
+        if point_feats:
+            # build the pool of point coordinates once as (N, 2) int array
+            points = data["coordinates"]
+            pool = np.empty((len(points), 2))
+            pool[:, 0] = np.fromiter((pt.x for pt in points), np.float64, len(points))
+            pool[:, 1] = np.fromiter((pt.y for pt in points), np.float64, len(points))
+            pool = pool.astype(np.int64)
+
+            # resolve the coordinates of all features using a single lookup
+            pts = pool[np.asarray(flat_idx, dtype=np.intp)].tolist()
+            for feat, i0, i1 in zip(point_feats, offsets[:-1], offsets[1:]):
+                if feat["type"] == "Point":
+                    feat["coordinates"] = pts[i0]
+                else:
+                    feat["coordinates"] = pts[i0:i1]
                 feat.pop("reset_coords", None)
         data.pop("coordinates", None)
         return data
 
     def _topo(self, data):
-        self.output["arcs"] = data["linestrings"]
-        del data["linestrings"]
+        data["arcs"] = data.pop("linestrings")
 
-        # apply delta-encoding if prequantization is applied
+        # apply delta-encoding if prequantization is applied. This is deferred until
+        # the output is requested, so toposimplify can use the arcs without decoding
         if self.options.prequantize > 0:
-            self.output["arcs"] = delta_encoding(self.output["arcs"])
+            self._delta_pending = True
         else:
-            for idx, ls in enumerate(self.output["arcs"]):
-                self.output["arcs"][idx] = np.array(ls).tolist()
+            # only normalize arcs that are not yet nested lists
+            for idx, ls in enumerate(data["arcs"]):
+                if hasattr(ls, "coords"):
+                    data["arcs"][idx] = np.asarray(ls.coords).tolist()
+                elif isinstance(ls, np.ndarray):
+                    data["arcs"][idx] = ls.tolist()
 
         # toposimplify linestrings if required
         if self.options.toposimplify > 0:
             # set default if not specifically given in the options
-            if type(self.options.toposimplify) == bool:
+            if isinstance(self.options.toposimplify, bool):
                 simplify_factor = 0.0001
             else:
                 simplify_factor = self.options.toposimplify
 
             self.toposimplify(epsilon=simplify_factor, _input_as="array", inplace=True)
 
-        return self.output
+        return data
@@ -1,6 +1,10 @@
 import itertools
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import shapely
 from shapely import geometry
 from shapely import wkt
 from shapely.strtree import STRtree
@@ -8,6 +12,8 @@ import pprint
 import copy
 import logging
 
+SHAPELY_GE_20 = int(shapely.__version__.split(".")[0]) >= 2
+
 
 def asvoid(arr):
     """
@@ -349,18 +355,91 @@ def lists_from_np_array(np_array):
 
 
 def np_array_from_arcs(arcs):
-    max_len_arc = len(max(arcs, key=len))
+    """
+    Function to create a numpy array from arcs of different lengths. Arcs that
+    contain less coordinates than the longest arc are filled with np.nan values.
+
+    Parameters
+    ----------
+    arcs : list of lists
+        list containing the coordinates of each arc
+
+    Returns
+    -------
+    np_array : numpy.ndarray
+        array of shape (no_arcs, max_len_arc, 2), padded with np.nan
+    lengths : numpy.ndarray
+        number of coordinates of each arc
+    """
+
+    lengths = np.array([len(arc) for arc in arcs], dtype=np.int64)
     no_arcs = len(arcs)
-    np_array = np.empty((no_arcs, max_len_arc, 2))
+    np_array = np.empty((no_arcs, lengths.max(), 2))
     np_array.fill(np.nan)
     for idx in range(no_arcs):
-        np_array[idx, 0 : len(arcs[idx])] = arcs[idx]
-    return np_array
+        np_array[idx, 0 : lengths[idx]] = arcs[idx]
+    return np_array, lengths
 
 
-def dequantize(np_arcs, scale, translate):
-    dequantized_arcs = np_arcs.cumsum(axis=1) * scale + translate
-    return dequantized_arcs
+def np_array_from_arcs_int(arcs, dtype=np.int32):
+    """
+    Function to create an integer numpy array from quantized arcs of different
+    lengths. Equal to `np_array_from_arcs`, but arcs that contain less coordinates
+    than the longest arc are filled with zeros, so only the first `lengths[idx]`
+    coordinates of each arc are valid. Non-integer coordinates are truncated.
+
+    Parameters
+    ----------
+    arcs : list of lists
+        list containing the quantized coordinates of each arc
+    dtype : numpy.dtype, optional
+        integer type of the array. The default `np.int32` is sufficient for
+        quantization factors up to 2**31 - 1.
+
+    Returns
+    -------
+    np_array : numpy.ndarray
+        array of shape (no_arcs, max_len_arc, 2), padded with zeros
+    lengths : numpy.ndarray
+        number of coordinates of each arc
+    """
+
+    lengths = np.array([len(arc) for arc in arcs], dtype=np.int64)
+    no_arcs = len(arcs)
+    np_array = np.zeros((no_arcs, lengths.max(), 2), dtype=dtype)
+    for idx in range(no_arcs):
+        np_array[idx, 0 : lengths[idx]] = arcs[idx]
+    return np_array, lengths
+
+
+def dequantize(np_arcs, scale, translate, out=None):
+    """
+    Function to dequantize delta-encoded arcs stored in a padded numpy array.
+
+    Parameters
+    ----------
+    np_arcs : numpy.ndarray
+        padded array of delta-encoded and quantized arcs
+    scale : list
+        scale factors of the transform
+    translate : list
+        translate values of the transform
+    out : numpy.ndarray, optional
+        float array with the same shape as `np_arcs` to store the result in. This can
+        be `np_arcs` itself to dequantize in place. Default is `None`, which allocates
+        a new array.
+
+    Returns
+    -------
+    numpy.ndarray
+        array of dequantized arcs
+    """
+    if out is None:
+        out = np.empty(np_arcs.shape, dtype=np.float64)
+    np.cumsum(np_arcs, axis=1, out=out)
+    np.multiply(out, scale, out=out)
+    np.add(out, translate, out=out)
+    return out
 
 
 def get_matches(geoms, tree_idx):
@@ -511,6 +590,86 @@ def quantize(linestrings, bbox, quant_factor=1e6):
     return linestrings, transform_
 
 
+def quantize_many(arrays, bbox, quant_factor=1e6):
+    """
+    Function that snaps the coordinates of multiple numpy arrays to the same regular
+    grid. The transform is derived once from the bbox and shared by all arrays.
+
+    Parameters
+    ----------
+    arrays : list of numpy.ndarray
+        arrays with coordinates in the last dimension. Items that are `None` are
+        returned as `None`
+    bbox : array
+        bbox of all coordinates
+    quant_factor : int
+        Quantization factor. Normally this varies between 1e4, 1e5, 1e6. Where a
+        higher number means a bigger grid where the coordinates can snap to.
+
+    Returns
+    -------
+    arrays : list of numpy.ndarray
+        arrays with quantized coordinates
+    transform : dict
+        scale (kx, ky) and translation (x0, y0) values
+    """
+
+    x0, y0, x1, y1 = bbox
+    try:
+        kx = 1 / ((quant_factor - 1) / (x1 - x0))
+        ky = 1 / ((quant_factor - 1) / (y1 - y0))
+    except ZeroDivisionError:
+        # ZeroDivisionError: float division by zero
+        raise SystemExit("Cannot quantize when xmax-xmin OR ymax-ymin equals 0")
+
+    arrays = [
+        None if arr is None else np.round((arr - [x0, y0]) / [kx, ky])
+        for arr in arrays
+    ]
+
+    transform_ = {"scale": [kx, ky], "translate": [x0, y0]}
+
+    return arrays, transform_
+
+
+def remove_repeating_ndarray(np_arcs, lengths):
+    """
+    Function that removes consecutive repeating coordinates from a numpy array of
+    arcs. Arcs that would collapse into a single coordinate are kept as is.
+
+    Parameters
+    ----------
+    np_arcs : numpy.ndarray
+        array of shape (no_arcs, max_len_arc, 2), padded with np.nan
+    lengths : numpy.ndarray
+        number of coordinates of each arc
+
+    Returns
+    -------
+    np_arcs : numpy.ndarray
+        arcs where consecutive repeating coordinates are removed, padded with np.nan
+    lengths : numpy.ndarray
+        number of coordinates of each arc
+    """
+
+    # get boolean mask where consecutive repeating coordinates are filtered
+    valid = np.arange(np_arcs.shape[1]) < lengths[:, None]
+    keep = valid.copy()
+    keep[:, 1:] &= np.absolute(np.diff(np_arcs, axis=1)).sum(axis=2) != 0
+
+    # arcs that would collapse into a single coordinate are kept as is
+    collapsed = keep.sum(axis=1) == 1
+    keep[collapsed] = valid[collapsed]
+    lengths = keep.sum(axis=1)
+
+    # move the kept coordinates to the front and pad the remainder with np.nan
+    order = np.argsort(~keep, axis=1, kind="stable")
+    np_arcs = np.take_along_axis(np_arcs, order[:, :, None], axis=1)
+    np_arcs[~np.take_along_axis(keep, order, axis=1)] = np.nan
+
+    return np_arcs, lengths
+
+
 def simplify(
     linestrings,
     epsilon,
@@ -518,6 +677,8 @@ def simplify(
     package="simplification",
     input_as="linestring",
     prevent_oversimplify=True,
+    lengths=None,
+    parallel=False,
 ):
     """
     Function that simplifies linestrings. The goal of line simplification is to reduce
@@ -549,6 +710,15 @@ def simplify(
         different locations with different input types. Choose `linestring` if the input
         type are shapely.geometry.LineString or `array` if the input are numpy.array
         coordinates
+    lengths : numpy.ndarray, optional
+        Number of coordinates of each arc if `input_as` is `array`, as returned by
+        `np_array_from_arcs`. Derived from the np.nan padding if not given.
+    parallel : boolean or str, optional
+        If `True` and `input_as` is `array`, the arcs are split in chunks that are
+        simplified in separate processes. If `auto`, this is only done for more than
+        128 arcs on multiple cores, when processes can be started using `fork` and
+        when the arcs cannot be simplified at once using shapely 2.
+        Default is `False`.
 
     Returns
     -------
@@ -561,12 +731,38 @@ def simplify(
     * https://www.jasondavies.com/simplify/
     * https://bost.ocks.org/mike/simplify/
     """
+    if input_as == "array" and lengths is None:
+        lengths = (~np.isnan(linestrings[:, :, 0])).sum(axis=1)
+
+    if parallel == "auto":
+        parallel = _parallel_auto(len(linestrings), package)
+    if parallel and input_as == "array":
+        return _simplify_parallel(
+            linestrings,
+            lengths,
+            epsilon=epsilon,
+            algorithm=algorithm,
+            package=package,
+            prevent_oversimplify=prevent_oversimplify,
+        )
+
     if package == "shapely":
 
-        if input_as == "array":
+        if input_as == "array" and SHAPELY_GE_20:
+            # simplify all arcs at once as array of LineStrings
+            valid = np.arange(linestrings.shape[1]) < lengths[:, None]
+            arcs_idx = np.repeat(np.arange(len(lengths)), lengths)
+            arcs = shapely.linestrings(linestrings[valid], indices=arcs_idx)
+            arcs = shapely.simplify(
+                arcs, epsilon, preserve_topology=prevent_oversimplify
+            )
+            coords, arcs_idx = shapely.get_coordinates(arcs, return_index=True)
+            splits = np.cumsum(np.bincount(arcs_idx, minlength=len(arcs)))[:-1]
+            list_arcs = [ls.tolist() for ls in np.split(coords, splits)]
+        elif input_as == "array":
             list_arcs = []
-            for ls in linestrings:
-                coords_to_simp = ls[~np.isnan(ls)[:, 0]]
+            for idx, ls in enumerate(linestrings):
+                coords_to_simp = ls[: lengths[idx]]
                 simple_ls = geometry.LineString(coords_to_simp)
                 simple_ls = simple_ls.simplify(
                     epsilon, preserve_topology=prevent_oversimplify
@@ -602,8 +798,8 @@ def simplify(
 
         if input_as == "array":
             list_arcs = []
-            for ls in linestrings:
-                coords_to_simp = ls[~np.isnan(ls)[:, 0]]
+            for idx, ls in enumerate(linestrings):
+                coords_to_simp = ls[: lengths[idx]]
                 simple_ls = alg(coords_to_simp, epsilon)
                 list_arcs.append(simple_ls.tolist())
         elif input_as == "linestring":
@@ -622,6 +818,45 @@ def simplify(
     return list_arcs
 
 
+def _parallel_auto(no_arcs, package):
+    """
+    Decide if arcs are simplified in parallel when `parallel` is set to `auto` in the
+    `simplify` function.
+    """
+    return (
+        no_arcs > 128
+        and (os.cpu_count() or 1) > 1
+        and multiprocessing.get_start_method() == "fork"
+        and not (package == "shapely" and SHAPELY_GE_20)
+    )
+
+
+def _simplify_parallel(linestrings, lengths, **kwargs):
+    """
+    Simplify the padded array of arcs of the `simplify` function in chunks that are
+    divided over separate processes. Each process simplifies its chunk serially.
+    """
+    kwargs.update(input_as="array", parallel=False)
+    no_chunks = os.cpu_count() or 1
+    chunks = []
+    for chunk in np.array_split(np.arange(len(linestrings)), no_chunks):
+        if chunk.size:
+            chunk_lengths = lengths[chunk]
+            chunk_arcs = linestrings[chunk, : chunk_lengths.max()]
+            chunks.append((chunk_arcs, chunk_lengths, kwargs))
+    with ProcessPoolExecutor(len(chunks)) as executor:
+        list_arcs = executor.map(_simplify_chunk, chunks)
+    return list(itertools.chain.from_iterable(list_arcs))
+
+
+def _simplify_chunk(chunk):
+    """
+    Simplify a chunk of arcs within a worker process of the `simplify` function.
+    """
+    linestrings, lengths, kwargs = chunk
+    return simplify(linestrings, lengths=lengths, **kwargs)
+
+
 def winding_order(geom, order="CW_CCW"):
     """
     Function that force a certain winding order on the resulting output geometries. One
@@ -758,6 +993,28 @@ def delta_encoding(linestrings):
     return linestrings
 
 
+def delta_encoding_ndarray(np_arcs):
+    """
+    Function to apply delta-encoding on a numpy array of arcs. Equal to the
+    `delta_encoding` function, but operates on the padded array as returned by
+    `np_array_from_arcs`.
+
+    Parameters
+    ----------
+    np_arcs : numpy.ndarray
+        array of shape (no_arcs, max_len_arc, 2), padded with np.nan
+
+    Returns
+    -------
+    np_arcs : numpy.ndarray
+        delta-encoded arcs, padded with np.nan
+    """
+
+    delta_arcs = np_arcs.copy()
+    delta_arcs[:, 1:] -= np_arcs[:, :-1]
+    return delta_arcs
+
+
 def find_duplicates(segments_list):
     """
     Function for solely detecting and recording duplicate LineStrings. The function 
@@ -4,6 +4,11 @@ import numpy as np
 import pprint
 import json
 import types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from .ops import dequantize
 from .ops import np_array_from_arcs
 
@@ -50,6 +55,7 @@ class TopoOptions(object):
         simplify_with="shapely",
         simplify_algorithm="dp",
         winding_order=None,
+        parallel=False,
     ):
         # get all arguments
         arguments = locals()
@@ -106,6 +112,11 @@ class TopoOptions(object):
         else:
             self.winding_order = None
 
+        if "parallel" in arguments:
+            self.parallel = arguments["parallel"]
+        else:
+            self.parallel = False
+
     def __repr__(self):
         return "TopoOptions(\n  {}\n)".format(pprint.pformat(self.__dict__))
 
@@ -410,17 +421,14 @@ def serialize_as_svg(topo_object, separate=False, include_junctions=False):
             # dequantize if quantization is applied
             if "transform" in keys:
 
-                np_arcs = np_array_from_arcs(arcs)
+                np_arcs, lengths = np_array_from_arcs(arcs)
 
                 transform = topo_object["transform"]
                 scale = transform["scale"]
                 translate = transform["translate"]
 
-                np_arcs = dequantize(np_arcs, scale, translate)
-                l_arcs = []
-                for ls in np_arcs:
-                    l_arcs.append(ls[~np.isnan(ls)[:, 0]].tolist())
-                arcs = l_arcs
+                np_arcs = dequantize(np_arcs, scale, translate, out=np_arcs)
+                arcs = [np_arcs[i, : lengths[i]].tolist() for i in range(len(lengths))]
 
             arcs = [geometry.LineString(arc) for arc in arcs]
 
@@ -452,6 +460,50 @@ def serialize_as_svg(topo_object, separate=False, include_junctions=False):
         display(geometry.MultiLineString(arcs))
 
 
+def dumps_json(obj):
+    """
+    Serialize an object to a compact JSON string. Uses `orjson` if it is installed,
+    which also serializes numpy types, and the standard `json` module otherwise.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # types that are not supported by orjson are left to json
+            pass
+    return json.dumps(obj)
+
+
+def serialize_as_json_stream(topo_object, fp):
+    """
+    Write a compact JSON representation of the topology to an open file object. The
+    arcs are serialized one by one, so no single string of the whole topology is
+    constructed.
+
+    Parameters
+    ----------
+    topo_object : dict
+        dictionary of the topology
+    fp : file object
+        file object opened for writing text
+    """
+    for idx, (key, value) in enumerate(topo_object.items()):
+        fp.write("{" if idx == 0 else ",")
+        fp.write(dumps_json(key) + ":")
+        if key == "arcs":
+            fp.write("[")
+            for idx_arc, arc in enumerate(value):
+                if idx_arc:
+                    fp.write(",")
+                fp.write(dumps_json(arc))
+            fp.write("]")
+        else:
+            fp.write(dumps_json(value))
+    fp.write("}\n" if topo_object else "{}\n")
+
+
 def serialize_as_json(topo_object, fp, pretty=False, indent=4, maxlinelength=88):
     if fp:
         with open(fp, "w") as f:
@@ -461,12 +513,12 @@ def serialize_as_json(topo_object, fp, pretty=False, indent=4, maxlinelength=88)
                     file=f,
                 )
             else:
-                print(topo_object, file=f)
+                serialize_as_json_stream(topo_object, f)
     else:
         if pretty:
             return prettyjson(topo_object, indent=indent, maxlinelength=maxlinelength)
         else:
-            return json.dumps(topo_object)
+            return dumps_json(topo_object)
 
 
 def serialize_as_geojson(
@@ -483,15 +535,15 @@ def serialize_as_geojson(
     # prepare arcs from topology object
     arcs = topo_object["arcs"]
     transform = None
-    if "transform" in topo_object.keys():
+    if "transform" in topo_object:
         transform = topo_object["transform"]
         scale = transform["scale"]
         translate = transform["translate"]
 
     if arcs:
-        np_arcs = np_array_from_arcs(arcs)
+        np_arcs, _ = np_array_from_arcs(arcs)
         # dequantize if quantization is applied
-        np_arcs = dequantize(np_arcs, scale, translate)
+        np_arcs = dequantize(np_arcs, scale, translate, out=np_arcs)
     else:
         np_arcs = None
 
@@ -504,7 +556,7 @@ def serialize_as_geojson(
     # fill the featurecollection with geometry object members
     for index, feature in enumerate(features):
         f = {"id": index, "type": "Feature"}
-        if "properties" in feature.keys():
+        if "properties" in feature:
             f["properties"] = feature["properties"].copy()
 
         # the transform is only used in cases of points or multipoints